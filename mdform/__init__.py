@@ -11,37 +11,97 @@
 
 from __future__ import annotations
 
-import pkg_resources
+import concurrent.futures
+import functools
+import threading
+import typing
+from importlib.metadata import PackageNotFoundError, version
+
 from markdown import Markdown
 
 from .extension import (
     FormExtension,
+    FormPreprocessor,
     Sanitizer,
     FormDefinition,
     FieldFormatter,
     default_field_formatter,
+    default_label_sanitizer,
 )
 from .fields import Field
 
 try:  # pragma: no cover
-    __version__ = pkg_resources.get_distribution("mdform").version
-except Exception:  # pragma: no cover
+    __version__ = version("mdform")
+except PackageNotFoundError:  # pragma: no cover
     # we seem to have a local copy not installed without setuptools
     # so the reported version will be unknown
     __version__ = "unknown"
 
 
+#: Per-thread cache of Markdown instances, keyed by formatter.
+#: Building the full markdown pipeline dominates the cost of parsing
+#: short documents, so instances are reused across parse() calls.
+#: Bounded so that callers passing a fresh formatter per call (e.g.
+#: closures) do not accumulate one pipeline per call.
+_local = threading.local()
+
+_MD_CACHE_MAXSIZE = 8
+
+
 def parse(
     text: str, formatter: FieldFormatter = default_field_formatter
 ) -> tuple[str, FormDefinition]:
-    md = Markdown(extensions=[FormExtension(formatter=formatter)])
+    try:
+        cache: dict[FieldFormatter, Markdown] = _local.md_cache
+    except AttributeError:
+        cache = _local.md_cache = {}
+
+    md = cache.get(formatter)
+    if md is None:
+        if len(cache) >= _MD_CACHE_MAXSIZE:
+            # Evict the oldest entry (dicts preserve insertion order).
+            del cache[next(iter(cache))]
+        md = cache[formatter] = Markdown(extensions=[FormExtension(formatter=formatter)])
+    else:
+        md.reset()
+
     html = md.convert(text)
     form_def: FormDefinition = md.mdform_definition  # type: ignore
     return html, form_def
 
 
+def parse_form_only(
+    text: str, sanitizer: Sanitizer = default_label_sanitizer
+) -> FormDefinition:
+    """Extract the form definition without rendering any HTML.
+
+    Runs only the form preprocessor over the document lines,
+    skipping the rest of the markdown pipeline. Useful for callers
+    that consume the field schema but never display the document.
+    """
+    pre = FormPreprocessor(sanitizer=sanitizer)
+    pre.run(text.split("\n"))
+    return pre.mdform_definition
+
+
+def parse_many(
+    texts: typing.Iterable[str],
+    formatter: FieldFormatter = default_field_formatter,
+    workers: int | None = None,
+) -> list[tuple[str, FormDefinition]]:
+    """Parse a batch of documents in parallel, one process per worker.
+
+    Each document is independent, so batches scale with the number of
+    cores. The formatter must be picklable (e.g. a module-level function).
+    """
+    with concurrent.futures.ProcessPoolExecutor(workers) as ex:
+        return list(ex.map(functools.partial(parse, formatter=formatter), texts))
+
+
 __all__ = (
     "FormExtension",
+    "parse_form_only",
+    "parse_many",
     "__version__",
     "Markdown",
     "parse",
@@ -11,7 +11,9 @@
 
 from __future__ import annotations
 
+import functools
 import re
+import sys
 import typing as ty
 from typing import Any
 import unidecode
@@ -19,20 +21,50 @@ from markdown import Markdown
 from markdown.extensions import Extension
 from markdown.preprocessors import Preprocessor
 
+from . import fields
 from .fields import COLLAPSE_CLOSE_RE, COLLAPSE_OPEN_RE, SECTION_RE, Field
 
 COLLAPSE_OPEN_HTML = r'<div id="accordion-%s">'
 COLLAPSE_CLOSE_HTML = r"</div>"
 
+#: All structural markers fused into a single alternation so that one
+#: regex call per line decides which (if any) marker fired.
+#: Compiled lazily, on the first parsed document.
+_STRUCTURAL_RE = fields._LazyPattern(
+    "(?P<section>%s)|(?P<copen>%s)|(?P<cclose>%s)"
+    % (
+        SECTION_RE.pattern.replace("?P<name>", "?P<section_name>"),
+        COLLAPSE_OPEN_RE.pattern.replace("?P<name>", "?P<copen_name>"),
+        COLLAPSE_CLOSE_RE.pattern,
+    )
+)
+
 
 FormDefinition = dict[str, Field]
 Sanitizer = ty.Callable[[str], str]
 FieldFormatter = ty.Callable[[str, Field], str]
 
 
+#: Characters that are not valid in an identifier.
+_INVALID_RE = re.compile(r"[^0-9a-zA-Z_]")
+
+#: Maps every code point below 256 that is not valid in an identifier to "_",
+#: so invalid characters are replaced in a single C-level pass.
+_SAN_TABLE = str.maketrans(
+    {chr(c): "_" for c in range(256) if _INVALID_RE.match(chr(c))}
+)
+
+#: Leading characters until a letter or underscore is found.
+_LEADING_RE = re.compile(r"^[^a-zA-Z_]+")
+
+
+@functools.lru_cache(maxsize=4096)
 def default_label_sanitizer(s: str) -> str:
     """Default label to variable sanitizer
 
+    Labels repeat across lines and documents, so results
+    are memoized.
+
     Parameters
     ----------
     s : str
@@ -44,13 +76,17 @@ def default_label_sanitizer(s: str) -> str:
         an identifier representing the variable
     """
 
-    out: str = unidecode.unidecode(s)
+    if s.isascii():
+        # unidecode is only needed to transliterate non-ASCII characters.
+        out = s
+    else:
+        out = unidecode.unidecode(s)
 
     # Remove invalid characters
-    out = re.sub(r"[^0-9a-zA-Z_]", "_", out)
+    out = out.translate(_SAN_TABLE)
 
     # Remove leading characters until we find a letter or underscore
-    out = re.sub(r"^[^a-zA-Z_]+", "_", out)
+    out = _LEADING_RE.sub("_", out)
 
     return out
 
@@ -70,13 +106,14 @@ def default_field_formatter(variable_name: str, field: Field) -> str:
     str
         an HTML or similar formatter.
     """
-    return "{{ " + f"form.{variable_name}" + " }}"
+    return f"{{{{ form.{variable_name} }}}}"
 
 
 def _value_to_name(value: str | None) -> str:
-    if value is None:
+    if not value:
         return ""
-    return value.lower().strip()
+    # Strip first so that lowercasing works on the shortest string.
+    return value.strip().lower()
 
 
 class FormPreprocessor(Preprocessor):
@@ -93,7 +130,7 @@ class FormPreprocessor(Preprocessor):
 
     def __init__(
         self,
-        md: Markdown,
+        md: Markdown | None = None,
         sanitizer: Sanitizer = default_label_sanitizer,
         formatter: FieldFormatter = default_field_formatter,
     ):
@@ -101,48 +138,81 @@ class FormPreprocessor(Preprocessor):
         self.sanitizer = sanitizer
         self.formatter = formatter
 
-    def run(self, lines: ty.Iterable[str]) -> list[str]:
+    def run(self, lines: list[str]) -> list[str]:
         """Parse Form and store in Markdown.Form."""
         unnamed_collapese_cnt = 0
         form = {}
-        section = None
+        # Section prefix, recomputed only when the section changes so
+        # that field lines pay one concatenation instead of formatting
+        # the section name each time.
+        prefix = ""
+
+        # Preallocated to the input size (the output is never larger),
+        # trimmed to the written length at the end.
+        out: list[str] = [""] * len(lines)
+        w = 0
+
+        # Bind hot attributes to locals: avoids repeated global and
+        # attribute lookups inside the per-line loop.
+        structural_match = _STRUCTURAL_RE.match
+        from_str = Field._from_str_or_none
+        sanitizer = self.sanitizer
+        formatter = self.formatter
 
-        out: list[str] = []
         for line in lines:
-            m1 = SECTION_RE.match(line)
-            if m1:
-                section = _value_to_name(m1.group("name"))
+            # Most lines in a markdown document are not form related.
+            # Checking the first non-blank character is much cheaper than
+            # trying every regex, so we dispatch on it and let the regexes
+            # remain authoritative within each branch.
+            first = line.lstrip()[:1]
+
+            if first == "[":
+                m1 = structural_match(line)
+                if m1 is None:
+                    out[w] = line
+                    w += 1
+                    continue
+
+                if m1.group("section") is not None:
+                    section = _value_to_name(m1.group("section_name"))
+                    prefix = sys.intern(section + "_") if section else ""
+                    continue
+
+                if m1.group("copen") is not None:
+                    control_field = _value_to_name(m1.group("copen_name"))
+                    if control_field:
+                        control_field = sanitizer(control_field)
+                    else:
+                        control_field = str(unnamed_collapese_cnt)
+                        unnamed_collapese_cnt += 1
+                    if prefix:
+                        control_field = prefix + control_field
+
+                    out[w] = f'<div id="accordion-{control_field}">'
+                    w += 1
+                    continue
+
+                out[w] = COLLAPSE_CLOSE_HTML
+                w += 1
                 continue
 
-            m1 = COLLAPSE_OPEN_RE.match(line)
-            if m1:
-                control_field = _value_to_name(m1.group("name"))
-                if control_field:
-                    control_field = self.sanitizer(control_field)
-                else:
-                    control_field = str(unnamed_collapese_cnt)
-                    unnamed_collapese_cnt += 1
-                if section:
-                    control_field = "{}_{}".format(section, control_field)
-
-                out.append(COLLAPSE_OPEN_HTML % control_field)
+            if "=" not in line or not (first.isalnum() or first == "_"):
+                out[w] = line
+                w += 1
                 continue
 
-            m1 = COLLAPSE_CLOSE_RE.match(line)
-            if m1:
-                out.append(COLLAPSE_CLOSE_HTML)
+            field = from_str(line)
+            if field is None:
+                out[w] = line
+                w += 1
                 continue
 
-            try:
-                field = Field.from_str(line)
-            except ValueError:
-                out.append(line)
-                continue
+            variable_name = sanitizer(field.label.lower())
 
-            variable_name = self.sanitizer(field.label.lower())
+            if prefix:
+                variable_name: str = prefix + variable_name
 
-            if section:
-                variable_name: str = "{}_{}".format(section, variable_name)
+            variable_name = sys.intern(variable_name)
 
             if variable_name in form:
                 raise ValueError(
@@ -151,9 +221,13 @@ class FormPreprocessor(Preprocessor):
 
             form[variable_name] = field
 
-            out.append(self.formatter(variable_name, field))
+            out[w] = formatter(variable_name, field)
+            w += 1
 
-        self.md.mdform_definition = form  # type: ignore
+        del out[w:]
+        self.mdform_definition = form
+        if self.md is not None:
+            self.md.mdform_definition = form  # type: ignore
         return out
 
 
@@ -10,10 +10,10 @@
                                 (length is optional)
         - IntegerField          ###[min:max:step]
                                 (min, max, step are optional)
-        - DecimalField          #.#[min:max:step:places]
-                                (min, max, step, places are optional)
         - FloatField            #.#f[min:max:step]
                                 (min, max, step are optional)
+        - DecimalField          #.#[min:max:step:places]
+                                (min, max, step, places are optional)
         - TextAreaField         AAA[length]
                                 (length is optional)
         - DateField             d/m/y
@@ -46,29 +46,70 @@
 
 from __future__ import annotations
 
+import dataclasses
+import functools
 import re
+import types
 import typing
 from abc import abstractmethod
 from dataclasses import dataclass
-from typing import Any, Match, Pattern, ClassVar, TypeVar
-
-from dataclass_wizard import JSONWizard
+from typing import Any, Mapping, Match, Pattern, ClassVar, TypeVar
 
 #: End of s with spaces or tabs before.
 EOL = r"[ \t]?$"
 
+
+class _LazyPattern:
+    """A regex pattern that is compiled on first use.
+
+    Avoids paying compilation cost at import time for users
+    that never parse a form. The `pattern` string is available
+    without triggering compilation.
+    """
+
+    def __init__(self, pattern: str, flags: int = re.UNICODE):
+        self.pattern = pattern
+        self.flags = flags
+
+    def __getattr__(self, name: str) -> Any:
+        attr = getattr(re.compile(self.pattern, self.flags), name)
+        setattr(self, name, attr)
+        return attr
+
+
 #: Section definition.
-SECTION_RE = re.compile(r"\[section[ \t]*(:(?P<name>.*))?\]", re.UNICODE)
+SECTION_RE = _LazyPattern(r"\[section[ \t]*(:(?P<name>.*))?\]")
 
 #: Open of collapsable part.
-COLLAPSE_OPEN_RE = re.compile(r"\[collapse[ \t]*(:(?P<name>.*))?\]", re.UNICODE)
+COLLAPSE_OPEN_RE = _LazyPattern(r"\[collapse[ \t]*(:(?P<name>.*))?\]")
 
 #: Close of collapsable part.
-COLLAPSE_CLOSE_RE = re.compile(r"\[endcollapse]")
+COLLAPSE_CLOSE_RE = _LazyPattern(r"\[endcollapse]", 0)
+
+#: Splits select content on commas, except commas inside a
+#: parenthesized (default) choice.
+_SELECT_SPLIT_RE = _LazyPattern(r",(?![^()]*\))")
 
 
 T = TypeVar("T")
 
+try:  # Atomic groups require Python 3.11+.
+    re.compile("(?>x)")
+    _HAS_ATOMIC = True
+except re.error:  # pragma: no cover
+    _HAS_ATOMIC = False
+
+
+def _atomic(pattern: str) -> str:
+    """Wrap a pattern in an atomic group when supported.
+
+    Atomic groups never give back characters, preventing quadratic
+    backtracking in patterns with overlapping character classes.
+    """
+    if _HAS_ATOMIC:
+        return f"(?>{pattern})"
+    return pattern  # pragma: no cover
+
 
 def _strgroup(m: Match[str], groupname: str) -> str:
     out = m.group(groupname)
@@ -91,44 +132,51 @@ def _strgroup_none(m: Match[str], groupname: str) -> str | None:
     return _strgroup(m, groupname)
 
 
-def _parse_or_none(el: str, typ: typing.Callable[[str], T]) -> T | None:
-    el = el.strip()
-    if el:
-        return typ(el)
-    return None
-
-
-def _parse_or_raise(el: str, typ: typing.Callable[[str], T]) -> T:
-    el = el.strip()
-    if not el:
-        raise ValueError("Cannot parse an empty string.")
-    return typ(el)
-
-
 def _parse_range_args(
     input: str | None, typ: typing.Callable[[str], T]
 ) -> tuple[T | None, T | None, T | None]:
     if input is None:
         return None, None, None
 
+    return _parse_range_args_cached(input, typ)
+
+
+@functools.lru_cache(maxsize=256)
+def _parse_range_args_cached(
+    input: str, typ: typing.Callable[[str], T]
+) -> tuple[T | None, T | None, T | None]:
+    # Forms are commonly built from shared templates, so the same
+    # range specification strings show up again and again.
     s = input.lower().strip()
 
     if s == "":
         raise ValueError("Could not parse range arguments from empty string.")
 
-    parts = [_parse_or_none(el, typ) for el in s.split(":")]
+    parts = s.split(":")
+
+    if len(parts) > 3:
+        raise ValueError(
+            f"Could not parse range arguments from {input}."
+            f"Up to 3 values expected, {len(parts)} given."
+        )
+
+    # Convert in place: no helper frames, no intermediate sequence.
+    p0 = parts[0].strip()
+    first = typ(p0) if p0 else None
 
     if len(parts) == 1:
-        return None, parts[0], None
-    elif len(parts) == 2:
-        return parts[0], parts[1], None
-    elif len(parts) == 3:
-        return parts[0], parts[1], parts[2]
+        return None, first, None
 
-    raise ValueError(
-        f"Could not parse range arguments from {input}."
-        f"Up to 3 values expected, {len(parts)} given."
-    )
+    p1 = parts[1].strip()
+    second = typ(p1) if p1 else None
+
+    if len(parts) == 2:
+        return first, second, None
+
+    p2 = parts[2].strip()
+    third = typ(p2) if p2 else None
+
+    return first, second, third
 
 
 def _parse_range_round_args(
@@ -151,9 +199,14 @@ def _parse_range_round_args(
         )
 
     if len(parts) == 4:
-        ndigits = _parse_or_raise(parts[3], int)
+        p3 = parts[3].strip()
+        if not p3:
+            raise ValueError("Cannot parse an empty string.")
+        ndigits = int(p3)
 
-    range_parts = [_parse_or_none(el, float) for el in parts[:3]]
+    # Convert in place: no helper frames, no intermediate sequence.
+    stripped = [p.strip() for p in parts[:3]]
+    range_parts = [float(p) if p else None for p in stripped]
 
     if len(range_parts) == 1:
         return None, range_parts[0], None, ndigits
@@ -163,13 +216,20 @@ def _parse_range_round_args(
         return range_parts[0], range_parts[1], range_parts[2], ndigits
 
 
-class _RegexField(JSONWizard):
+class _RegexField:
     #: The regex pattern to match
     _PATTERN: str = ""
 
+    #: Flags used to compile _PATTERN. Patterns that only ever match
+    #: ASCII structural syntax may use re.ASCII for cheaper \w/\d tests.
+    _FLAGS: ClassVar[int] = re.UNICODE
+
     #: The compiled regex pattern to match.
     _REGEX: Pattern[str]
 
+    #: Bound `_REGEX.match`, see `__init_subclass__`.
+    _MATCH: ClassVar[typing.Callable[[str], Match[str] | None]]
+
     @classmethod
     def _preprocess_pattern(cls):
         """Overload this method in subclass to modify
@@ -179,7 +239,14 @@ class _RegexField(JSONWizard):
     def __init_subclass__(cls, **kwargs: Any):
         super().__init_subclass__(**kwargs)
         if cls._PATTERN:
-            cls._REGEX = re.compile(cls._preprocess_pattern(), re.UNICODE)
+            cls._REGEX = re.compile(cls._preprocess_pattern(), cls._FLAGS)
+            # Bound method saves one attribute lookup per call in the
+            # dispatch loop.
+            cls._MATCH = cls._REGEX.match
+
+    def to_dict(self) -> dict[str, Any]:
+        """Serialize this field to a plain dictionary."""
+        return dataclasses.asdict(self)
 
 
 @dataclass(frozen=True)
@@ -201,24 +268,41 @@ class Field(_RegexField):
 
     """
 
+    # The label body is atomic: everything after it can match empty, so
+    # giving characters back can never turn a failure into a match, and
+    # not doing so keeps rejection of '='-containing prose single-pass.
     _PATTERN = (
-        r"(?P<label>\w[\w \t\-]*)(?P<required>\*)?[ \t]*=[ \t]*(?P<pending>.*)[ \t]*"
+        r"(?P<label>\w"
+        + _atomic(r"[\w \t\-]*")
+        + r")(?P<required>\*)?[ \t]*=[ \t]*(?P<pending>.*)"
         + EOL
     )
 
-    _FIELD_TYPES: ClassVar[list[type[Field]]] = []
+    #: Registered specific field types. Kept as a tuple: registration is
+    #: rare, iteration is hot.
+    _FIELD_TYPES: ClassVar[tuple[type[SpecificField], ...]] = ()
+
+    #: Specific field types grouped by the first character of their marker,
+    #: so that matching a line tries only the relevant regexes.
+    _DISPATCH: ClassVar[dict[str, tuple[type[SpecificField], ...]]] = {}
+
+    #: Specific field types without a declared first character,
+    #: tried for every pending string.
+    _UNANCHORED_FIELD_TYPES: ClassVar[tuple[type[SpecificField], ...]] = ()
 
     original_label: str
     required: bool
     specific_field: SpecificField
 
-    @property
+    @functools.cached_property
     def is_label_hidden(self) -> bool:
         """Return true if the label is supposed to be hidden (starts with _)"""
         return self.original_label.startswith("_")
 
-    @property
+    @functools.cached_property
     def label(self) -> str:
+        # cached_property writes straight into the instance __dict__,
+        # which keeps the dataclass frozen for ordinary assignment.
         if self.is_label_hidden:
             return self.original_label[1:]
         return self.original_label
@@ -229,42 +313,82 @@ class Field(_RegexField):
 
         Returns None if no field was match
         """
-        m = cls._REGEX.match(s)
+        if "=" not in s:
+            # A labeled field always contains '='; checking it is a
+            # single C-level scan versus a full regex walk.
+            return None
+
+        m = cls._MATCH(s)
         if not m:
             return None
 
-        for ft in cls._FIELD_TYPES:
-            matched = ft.match(_strgroup(m, "pending"))
+        # One C call fetches all three groups; label and pending always
+        # participate in the match, so they are plain strings.
+        label, required, pending = m.group("label", "required", "pending")
+        pending = pending.strip()
+
+        anchored = cls._DISPATCH.get(pending[:1], ())
+
+        for ft in (*anchored, *cls._UNANCHORED_FIELD_TYPES):
+            matched = ft.match(pending)
 
             if matched is None:
                 continue
 
-            label = _strgroup(m, "label")
-            required = m.group("required") is not None
-
-            return label, required, ft(**matched)
+            return label.strip(), required is not None, ft(**matched)
 
         return None
 
     @classmethod
-    def from_str(cls, s: str) -> Field:
-        m = cls.match(s)
+    @functools.lru_cache(maxsize=2048)
+    def _from_str_or_none(cls, s: str) -> Field | None:
+        # Field lines repeat across documents built from shared
+        # templates; Field is frozen, so instances can be shared.
+        # Misses are cached too, so a repeated non-field line that
+        # happens to contain '=' is rejected with one dict lookup.
+        try:
+            m = cls.match(s)
+        except ValueError:
+            # A malformed specific field (e.g. a select with two
+            # collapse markers) is not a field line at all; the
+            # preprocessor leaves it untouched.
+            return None
         if m is not None:
             label, required, spefic_field = m
             return cls(label, required, spefic_field)
-        raise ValueError("Could not match labeled field")
+        return None
+
+    @classmethod
+    def from_str(cls, s: str) -> Field:
+        field = cls._from_str_or_none(s)
+        if field is None:
+            raise ValueError("Could not match labeled field")
+        return field
 
 
 class SpecificField(_RegexField):
     """Base class for all specific fields."""
 
+    #: First character of the field marker, used as a jump table key
+    #: in `Field.match`. Leave empty to be tried for every pending string.
+    _SIGIL: ClassVar[str] = ""
+
+    #: Set when the whole field marker is a fixed literal, so that
+    #: `match` compares strings instead of entering the regex engine.
+    _LITERAL: ClassVar[str] = ""
+
     @classmethod
     def _preprocess_pattern(cls):
-        return "[ \t]*" + cls._PATTERN + "[ \t]*" + EOL
+        return "[ \t]*" + cls._PATTERN + r"[ \t]*$"
 
     def __init_subclass__(cls, **kwargs: Any):
         super().__init_subclass__(**kwargs)
-        Field._FIELD_TYPES.append(cls)
+        Field._FIELD_TYPES = (*Field._FIELD_TYPES, cls)
+        if cls._SIGIL:
+            bucket = Field._DISPATCH.get(cls._SIGIL, ())
+            Field._DISPATCH[cls._SIGIL] = (*bucket, cls)
+        else:
+            Field._UNANCHORED_FIELD_TYPES = (*Field._UNANCHORED_FIELD_TYPES, cls)
 
     @classmethod
     @abstractmethod
@@ -288,7 +412,10 @@ class SpecificField(_RegexField):
             None indicates that the s was not matched.
         """
 
-        m = cls._REGEX.match(line)
+        if cls._LITERAL:
+            return {} if line.strip(" \t") == cls._LITERAL else None
+
+        m = cls._MATCH(line)
         if not m:
             return None
 
@@ -300,6 +427,8 @@ class StringField(SpecificField):
     """Used to take single string input."""
 
     _PATTERN = r"___(\[(?P<length>\d*)\])?"
+    _SIGIL = "_"
+    _FLAGS = re.ASCII
 
     length: int | None
 
@@ -309,7 +438,7 @@ class StringField(SpecificField):
         if length is not None:
             length = int(length)
 
-        return dict(length=length)
+        return {"length": length}
 
 
 @dataclass(frozen=True)
@@ -317,6 +446,8 @@ class IntegerField(SpecificField):
     """Used to take single integer input."""
 
     _PATTERN = r"###(\[(?P<range>[\d:]*)\])?"
+    _SIGIL = "#"
+    _FLAGS = re.ASCII
 
     min: int | None = None
     max: int | None = None
@@ -329,48 +460,52 @@ class IntegerField(SpecificField):
         except Exception:
             return None
 
-        return dict(min=mn, max=mx, step=step)
+        return {"min": mn, "max": mx, "step": step}
 
 
 @dataclass(frozen=True)
-class DecimalField(SpecificField):
-    """Used to take single decimal input."""
+class FloatField(SpecificField):
+    """Used to take single float input."""
 
-    _PATTERN = r"#\.#(\[(?P<range>[\d\.:]*)\])?"
+    _PATTERN = r"#\.#f(\[(?P<range>[\d\.:]*)\])?"
+    _SIGIL = "#"
+    _FLAGS = re.ASCII
 
     min: float | None = None
     max: float | None = None
     step: float | None = None
-    places: int | None = 2
 
     @classmethod
     def process(cls, m: Match[str]) -> dict[str, Any] | None:
         try:
-            mn, mx, step, places = _parse_range_round_args(_strgroup_none(m, "range"))
+            mn, mx, step = _parse_range_args(_strgroup_none(m, "range"), float)
         except Exception:
             return None
 
-        return dict(min=mn, max=mx, step=step, places=places)
+        return {"min": mn, "max": mx, "step": step}
 
 
 @dataclass(frozen=True)
-class FloatField(SpecificField):
-    """Used to take single float input."""
+class DecimalField(SpecificField):
+    """Used to take single decimal input."""
 
-    _PATTERN = r"#\.#f(\[(?P<range>[\d\.:]*)\])?"
+    _PATTERN = r"#\.#(\[(?P<range>[\d\.:]*)\])?"
+    _SIGIL = "#"
+    _FLAGS = re.ASCII
 
     min: float | None = None
     max: float | None = None
     step: float | None = None
+    places: int | None = 2
 
     @classmethod
     def process(cls, m: Match[str]) -> dict[str, Any] | None:
         try:
-            mn, mx, step = _parse_range_args(_strgroup_none(m, "range"), float)
+            mn, mx, step, places = _parse_range_round_args(_strgroup_none(m, "range"))
         except Exception:
             return None
 
-        return dict(min=mn, max=mx, step=step)
+        return {"min": mn, "max": mx, "step": step, "places": places}
 
 
 @dataclass(frozen=True)
@@ -378,6 +513,8 @@ class TextAreaField(SpecificField):
     """Used to take multi-line input."""
 
     _PATTERN = r"AAA(\[(?P<length>\d*)\])?"
+    _SIGIL = "A"
+    _FLAGS = re.ASCII
 
     length: int | None = None
 
@@ -387,7 +524,7 @@ class TextAreaField(SpecificField):
         if length is not None:
             length = int(length)
 
-        return dict(length=length)
+        return {"length": length}
 
 
 @dataclass(frozen=True)
@@ -398,10 +535,13 @@ class DateField(SpecificField):
     """
 
     _PATTERN = r"d/m/y"
+    _SIGIL = "d"
+    _LITERAL = "d/m/y"
+    _FLAGS = re.ASCII
 
     @classmethod
     def process(cls, m: Match[str]) -> dict[str, Any] | None:
-        return dict()
+        return {}
 
 
 @dataclass(frozen=True)
@@ -412,10 +552,13 @@ class TimeField(SpecificField):
     """
 
     _PATTERN = r"hh:mm"
+    _SIGIL = "h"
+    _LITERAL = "hh:mm"
+    _FLAGS = re.ASCII
 
     @classmethod
     def process(cls, m: Match[str]) -> dict[str, Any] | None:
-        return dict()
+        return {}
 
 
 @dataclass(frozen=True)
@@ -423,21 +566,26 @@ class EmailField(SpecificField):
     """A string field with email validation."""
 
     _PATTERN = r"@"
+    _SIGIL = "@"
+    _LITERAL = "@"
+    _FLAGS = re.ASCII
 
     @classmethod
     def process(cls, m: Match[str]) -> dict[str, Any] | None:
-        return dict()
+        return {}
 
 
 @dataclass(frozen=True)
 class RadioField(SpecificField):
     """Used to select among mutually exclusive inputs."""
 
-    _PATTERN = r"(?P<content>\(x?\)[ \t]*[\w \t\-]+[\(\)\w \t\-]*)"
-
-    _SUB_REGEX = re.compile(
-        r"\((?P<is_default>x?)\)[ \t]*(?P<label>[a-zA-Z0-9 \t_\-]*)", re.UNICODE
+    _PATTERN = (
+        r"(?P<content>\(x?\)[ \t]*"
+        + _atomic(r"[\w \t\-]+")
+        + _atomic(r"[\(\)\w \t\-]*")
+        + r")"
     )
+    _SIGIL = "("
 
     choices: tuple[str, ...]
     default: str
@@ -447,26 +595,39 @@ class RadioField(SpecificField):
         items: list[str] = []
         default = None
 
-        for matched in cls._SUB_REGEX.finditer(_strgroup(m, "content")):
-            label = matched.group("label").strip()
+        # Options are delimited by their leading "(x?)" marker, so plain
+        # string splitting avoids re-entering the regex engine per option.
+        # No need to strip the content: every option label is stripped
+        # individually below.
+        for part in m.group("content").split("(")[1:]:
+            if part.startswith(")"):
+                is_default = False
+                label = part[1:].strip()
+            elif part.startswith("x)"):
+                is_default = True
+                label = part[2:].strip()
+            else:
+                continue
 
             items.append(label)
 
-            if matched.group("is_default") == "x":
+            if is_default:
                 default = label
 
-        return dict(choices=tuple(items), default=default)
+        return {"choices": tuple(items), "default": default}
 
 
 @dataclass(frozen=True)
 class CheckboxField(SpecificField):
     """Used to select among non-exclusive inputs."""
 
-    _PATTERN = r"(?P<content>\[x?\][ \t]*[\w \t\-]+[\[\]\w \t\-]*)"
-    _SUB_REGEX = re.compile(
-        r"\[(?P<is_default>x?)\][ \t]*(?P<label>[a-zA-Z0-9 \t_\-]*)", re.UNICODE
+    _PATTERN = (
+        r"(?P<content>\[x?\][ \t]*"
+        + _atomic(r"[\w \t\-]+")
+        + _atomic(r"[\[\]\w \t\-]*")
+        + r")"
     )
-
+    _SIGIL = "["
     choices: tuple[str, ...]
     default: str
 
@@ -475,15 +636,26 @@ class CheckboxField(SpecificField):
         items: list[str] = []
         default: list[str] = []
 
-        for matched in cls._SUB_REGEX.finditer(_strgroup(m, "content")):
-            label = _strgroup(matched, "label").strip()
+        # Options are delimited by their leading "[x?]" marker, so plain
+        # string splitting avoids re-entering the regex engine per option.
+        # No need to strip the content: every option label is stripped
+        # individually below.
+        for part in m.group("content").split("[")[1:]:
+            if part.startswith("]"):
+                is_default = False
+                label = part[1:].strip()
+            elif part.startswith("x]"):
+                is_default = True
+                label = part[2:].strip()
+            else:
+                continue
 
             items.append(label)
 
-            if _strgroup(matched, "is_default") == "x":
+            if is_default:
                 default.append(label)
 
-        return dict(choices=tuple(items), default=tuple(default))
+        return {"choices": tuple(items), "default": tuple(default)}
 
 
 @dataclass(frozen=True)
@@ -491,6 +663,7 @@ class SelectField(SpecificField):
     """Used to select among mutually exclusive inputs, with a dropdown."""
 
     _PATTERN = r"\{(?P<content>([\w \t\->_,\(\)\[\]]+))\}"
+    _SIGIL = "{"
 
     choices: tuple[str, ...]
     default: str
@@ -503,7 +676,8 @@ class SelectField(SpecificField):
 
         collapse_on = None
 
-        for item in _strgroup(m, "content").split(","):
+        # No need to strip the content: every member is stripped below.
+        for item in _SELECT_SPLIT_RE.split(m.group("content")):
             is_default = False
 
             item = item.strip()
@@ -511,34 +685,36 @@ class SelectField(SpecificField):
                 item = item[1:-1].strip()
                 is_default = True
 
-            if "->" in item:
-                pair = tuple(s.strip() for s in item.split("->", 1))
+            head, sep, tail = item.partition("->")
+            if sep:
+                item0, item1 = head.strip(), tail.strip()
+            else:
+                item0 = item1 = item
+
+            # At most one collapse/open marker may appear, so scan for it
+            # once and strip it in a single replace per member.
+            if "[c]" in item0:
+                marker, prefix = "[c]", ""
+            elif "[o]" in item0:
+                marker, prefix = "[o]", "~"
             else:
-                pair = (item, item)
+                marker = None
 
-            if "[c]" in pair[0]:
-                # collapse
+            if marker is not None:
                 if collapse_on is not None:
                     raise ValueError("Can only collapse on a single item.")
-                item0 = pair[0].replace("[c]", "")
-                item1 = pair[1].replace("[c]", "")
-                collapse_on = item0
-                pair = (item0, item1)
-
-            if "[o]" in pair[0]:
-                # open
-                if collapse_on is not None:
+                item0 = item0.replace(marker, "")
+                item1 = item1.replace(marker, "")
+                if "[o]" in item0:
+                    # An item carrying both markers.
                     raise ValueError("Can only collapse on a single item.")
-                item0 = pair[0].replace("[o]", "")
-                item1 = pair[1].replace("[o]", "")
-                collapse_on = "~" + item0
-                pair = (item0, item1)
+                collapse_on = prefix + item0
 
-            items.append(pair)
+            items.append((item0, item1))
             if is_default:
-                default = pair[0]
+                default = item0
 
-        return dict(choices=tuple(items), default=default, collapse_on=collapse_on)
+        return {"choices": tuple(items), "default": default, "collapse_on": collapse_on}
 
 
 @dataclass(frozen=True)
@@ -546,22 +722,31 @@ class FileField(SpecificField):
     """Used to upload a file."""
 
     _PATTERN = r"\.\.\.(\[(?P<allowed>[\w \t,;]*)\])?"
+    _SIGIL = "."
 
     allowed: tuple[str, ...] | None
     description: str | None
 
+    #: Shared result for the common bare `...` case, skipping a dict
+    #: allocation per field. Read-only so callers cannot mutate it.
+    _EMPTY: ClassVar[Mapping[str, Any]] = types.MappingProxyType(
+        {"allowed": None, "description": None}
+    )
+
     @classmethod
-    def process(cls, m: Match[str]) -> dict[str, Any] | None:
+    def process(cls, m: Match[str]) -> Mapping[str, Any] | None:
         allowed = m.group("allowed") or None
-        description = None
 
-        if allowed is not None:
-            if ";" in allowed:
-                allowed, description = allowed.split(";", 1)
+        if allowed is None:
+            return cls._EMPTY
 
-            if "," in allowed:
-                allowed = tuple(s.strip() for s in allowed.split(","))
-            else:
-                allowed = (allowed,)
+        description = None
+        if ";" in allowed:
+            allowed, description = allowed.split(";", 1)
+
+        if "," in allowed:
+            allowed = tuple(s.strip() for s in allowed.split(","))
+        else:
+            allowed = (allowed,)
 
-        return dict(allowed=allowed, description=description)
+        return {"allowed": allowed, "description": description}
@@ -109,3 +109,26 @@ def test_parse_other_format():
         return "{{ " + f"{variable_name}" + " }}"
 
     assert parse(TEXT, formatter=fmt) == (DEFAULT_FORMATTED.replace("form.", ""), FORM)
+
+
+def test_parse_form_only():
+    from mdform import parse_form_only
+
+    assert parse_form_only(TEXT) == FORM
+
+
+def test_malformed_field_passes_through():
+    # A select with two collapse markers is not a valid field and
+    # must be rendered as plain text, not raise.
+    html, form = parse("choose = {A[c], B[o]}")
+    assert html == "<p>choose = {A[c], B[o]}</p>"
+    assert form == {}
+
+
+def test_parse_many():
+    from mdform import parse_many
+
+    texts = [TEXT, "other = @\n", "name = ___[30]\n"]
+    # The formatter must be picklable, so the (module-level) default
+    # formatter is used and the results must match sequential parse().
+    assert parse_many(texts, workers=2) == [parse(t) for t in texts]
@@ -1,5 +1,6 @@
 import pytest
 
+from mdform import fields
 from mdform.fields import (
     CheckboxField,
     DateField,
@@ -17,6 +18,11 @@ from mdform.fields import (
 )
 
 
+def test_registered_field_types():
+    # Each specific field type is registered exactly once.
+    assert len(Field._FIELD_TYPES) == len(set(Field._FIELD_TYPES)) == 12
+
+
 def test_label():
     assert Field.match("name = @") == ("name", False, EmailField())
     assert Field.match("name* = @") == ("name", True, EmailField())
@@ -240,6 +246,16 @@ def test_radio_field():
     assert f.specific_field.default == "B"
 
 
+def test_radio_checkbox_pathological():
+    # Long near-matching inputs must still be rejected. With atomic
+    # groups (see fields._atomic) rejection is linear; on older
+    # interpreters the fallback pattern backtracks quadratically, so
+    # use a shorter input there to keep the suite fast.
+    n = 5000 if fields._HAS_ATOMIC else 500
+    assert RadioField.match("() " + "A" * n + ",") is None
+    assert CheckboxField.match("[] " + "A" * n + ",") is None
+
+
 def test_select_field():
     assert SelectField.match("{ A, B, C") is None
     assert SelectField.match("{ A, B, C}") == dict(